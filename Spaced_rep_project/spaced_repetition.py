@@ -1,52 +1,285 @@
-import json
+import atexit
+from collections import defaultdict
 import math
 import os
 from datetime import datetime, timedelta, timezone
+import shlex
 import subprocess
+import threading
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, pretty=True):
+        return orjson.dumps(obj, option=(orjson.OPT_INDENT_2 if pretty else 0) | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, pretty=True):
+        return (json.dumps(obj, indent=2) if pretty else json.dumps(obj)).encode()
 DATA_FILE = "questions.json"
+DETAILS_FILE = "details.json"
+REVIEW_LOG_FILE = "reviews.jsonl"
 SCRIPT_FILE = "spaced_repetition.py"
+TRACKED_FILES = [SCRIPT_FILE, DATA_FILE, DETAILS_FILE, 'config']
+# kept in DATA_FILE and loaded at startup; everything else lives in DETAILS_FILE until needed
+SCHEDULE_FIELDS = ("problem_type", "company_tags", "last_reviewed", "next_review")
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
-config = {}
-with open('config', 'r') as f:
-    for line in f:
-        if '=' in line:
-            key, value = line.strip().split('=')
-            config[key.strip()] = value.strip()
+with open('config', 'r', newline='') as f:
+    config_text = f.read()
+# rewrite with the file's own line endings so toggling back restores it byte for byte
+config_newline = '\r\n' if '\r\n' in config_text else '\n'
+config = {
+    key.strip(): value.strip()
+    for key, separator, value in (line.partition('=') for line in config_text.splitlines())
+    if separator
+}
 
 config['COMPANY_PREP_MODE'] = config['COMPANY_PREP_MODE'].lower() == 'true'
 config['COMPANY_PREP_RETENTION_FACTOR'] = float(config['COMPANY_PREP_RETENTION_FACTOR'])
 request_retention = float(config['DEFAULT_RETENTION'])
-
-def commit(file_name):
+company_prep_mode = config['COMPANY_PREP_MODE']
+company_prep_target = config['COMPANY_PREP_TARGET']
+company_prep_retention_factor = config['COMPANY_PREP_RETENTION_FACTOR']
+loaded_config = dict(config)
+saved_config = dict(config)
+
+join_command = subprocess.list2cmdline if os.name == 'nt' else shlex.join
+dirty_files = set()
+committing_files = set()
+
+
+def changed_files(file_names):
+    existing = [file_name for file_name in file_names if os.path.exists(file_name)]
+    dirty = [file_name for file_name in existing if file_name in dirty_files]
+    if dirty:
+        # already known to need a commit, so skip asking git; unchanged files are no-ops for git add
+        return existing, dirty, True
+    # one git call catches what this session didn't write: hand edits, crashes, earlier failed commits
+    result = subprocess.run(['git', 'status', '--porcelain', '--branch', '--', *existing], capture_output=True, text=True)
+    lines = result.stdout.splitlines()
+    # the branch header says "[ahead N]" when an earlier push failed
+    unpushed = bool(lines) and lines[0].startswith('##') and '[ahead ' in lines[0]
+    modified = {os.path.basename(line[3:].strip('"')) for line in lines if line.strip() and not line.startswith('##')}
+    changed = [file_name for file_name in existing if file_name in modified]
+    return changed, changed, unpushed or bool(changed)
+
+
+def mark_file_dirty(file_name):
+    dirty_files.add(file_name)
+    # written again after a running commit picked it up, so that commit doesn't cover it
+    committing_files.discard(file_name)
+
+
+def git_command(changed, described):
+    commands = []
+    if changed:
+        commit_message = f"updated {', '.join(described)}"
+        commands.append(join_command(['git', 'add', '--', *changed]))
+        # skip an empty commit but still push, so an earlier failed push gets retried
+        commands.append(
+            f"({join_command(['git', 'diff', '--cached', '--quiet', '--', *changed])}"
+            f" || {join_command(['git', 'commit', '-m', commit_message, '--', *changed])})"
+        )
+    commands.append("git push")
+    return " && ".join(commands)
+
+
+def commit_all(file_names):
+    changed, described, needed = changed_files(file_names)
+    if not needed:
+        return
     try:
-        result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
-        if any(line.strip() and not line.startswith('??') for line in result.stdout.splitlines()):
-            subprocess.run(['git', 'add', file_name], check=True)
-            commit_message = f"updated {file_name}"
-            subprocess.run(['git', 'commit', '-m', commit_message], check=True)
-            subprocess.run(['git', 'push'], check=True)
-            print("Changes committed and pushed.")
+        subprocess.run(git_command(changed, described), shell=True, check=True)
+        dirty_files.difference_update(changed)
+        print("Changes committed and pushed.")
     except subprocess.CalledProcessError as e:
         print(f"Error during git operations: {e}")
 
+
+commit_thread = None
+commit_result = None
+
+
+def run_background_commit(command):
+    global commit_result
+    # no terminal: credential prompts would fight the menu for input, and Ctrl-C shouldn't kill git mid-commit
+    commit_result = subprocess.run(
+        command, shell=True, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+        env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}, start_new_session=True
+    )
+
+
+def commit_in_background(file_names):
+    global commit_thread
+    wait_for_commit()
+    changed, described, needed = changed_files(file_names)
+    if not needed:
+        return
+    committing_files.update(changed)
+    commit_thread = threading.Thread(target=run_background_commit, args=(git_command(changed, described),))
+    commit_thread.start()
+    print("Committing in the background...")
+
+
+def wait_for_commit():
+    # dirty_files is only touched here on the main thread, never by the commit thread
+    global commit_thread
+    if commit_thread is None:
+        return
+    commit_thread.join()
+    commit_thread = None
+    print(commit_result.stdout + commit_result.stderr, end="")
+    if commit_result.returncode == 0:
+        dirty_files.difference_update(committing_files)
+        print("Changes committed and pushed.")
+    else:
+        print(f"Error during git operations: exit status {commit_result.returncode}")
+    committing_files.clear()
+
+
+atexit.register(wait_for_commit)
+
+pending_changes = []
+details_loaded = False
+due_index = {}
+reviewed_index = {}
+company_index = {}
+
+
+def index_question(question):
+    details = questions[question]
+    due_index.setdefault(details["next_review"], set()).add(question)
+    reviewed_index.setdefault(details["last_reviewed"], set()).add(question)
+    for tag in details.get('company_tags', []):
+        company_index.setdefault(tag, set()).add(question)
+
+
+def unindex_question(question):
+    details = questions[question]
+    move_index(due_index, question, details["next_review"], None)
+    move_index(reviewed_index, question, details["last_reviewed"], None)
+    for tag in details.get('company_tags', []):
+        move_index(company_index, question, tag, None)
+
+
+def move_index(index, question, old_key, new_key):
+    names = index.get(old_key)
+    if names is not None:
+        names.discard(question)
+        if not names:
+            del index[old_key]
+    if new_key is not None:
+        index.setdefault(new_key, set()).add(question)
+
+
+def read_json(file_name):
+    if os.path.exists(file_name):
+        with open(file_name, "rb") as f:
+            try:
+                return json_loads(f.read()) or {}
+            except ValueError:
+                return {}
+    return {}
+
+
+def write_json(file_name, obj):
+    temp_file = file_name + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(json_dumps(obj))
+    os.replace(temp_file, file_name)
+    mark_file_dirty(file_name)
+
+
 def load_questions():
-    global questions
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
+    global questions, details_loaded
+    pending_changes.clear()
+    questions = read_json(DATA_FILE)
+    # older data files keep every field inline and have no separate details file
+    details_loaded = not os.path.exists(DETAILS_FILE)
+    if details_loaded:
+        for details in questions.values():
+            backfill_totals(details)
+    if os.path.exists(REVIEW_LOG_FILE):
+        load_details()
+        replay_review_log()
+    for index in (due_index, reviewed_index, company_index):
+        index.clear()
+    for question in questions:
+        index_question(question)
+
+
+def load_details():
+    global details_loaded
+    if details_loaded:
+        return
+    for question, details in read_json(DETAILS_FILE).items():
+        if question in questions:
+            questions[question].update(details)
+            backfill_totals(questions[question])
+    details_loaded = True
+
+
+def backfill_totals(details):
+    if "ratings_count" not in details:
+        details["ratings_sum"] = sum(5 if rating["rating"] >= 4 else rating["rating"] for rating in details["ratings"] if rating['rating'])
+        details["ratings_count"] = len(details["ratings"])
+    if "time_count" not in details:
+        details["time_sum"] = sum(time['time_taken'] for time in details["solving_time"])
+        details["time_count"] = len(details["solving_time"])
+
+
+def replay_review_log():
+    if not os.path.exists(REVIEW_LOG_FILE):
+        return
+    with open(REVIEW_LOG_FILE, "rb") as f:
+        for line in f:
             try:
-                questions = json.load(f)
-                if not questions:
-                    questions = {}
-            except json.JSONDecodeError:
-                questions = {}
-    else:
-        questions = {}
+                change = json_loads(line)
+            except ValueError:
+                continue
+            details = questions.setdefault(change["q"], {})
+            details.update(change.get("set", {}))
+            for key, item in change.get("append", {}).items():
+                details[key].append(item)
+
+
+def log_change(question, fields, appended=None):
+    change = {"q": question, "set": fields}
+    if appended:
+        change["append"] = appended
+    pending_changes.append(change)
 
 
 def save_questions():
-    with open(DATA_FILE, "w") as f:
-        json.dump(questions, f, indent=4)
-    commit(DATA_FILE)
+    if not pending_changes:
+        return
+    with open(REVIEW_LOG_FILE, "ab") as f:
+        f.write(b"".join(json_dumps(change, pretty=False) + b"\n" for change in pending_changes))
+    pending_changes.clear()
+
+
+def compact_questions():
+    save_questions()
+    if not os.path.exists(REVIEW_LOG_FILE):
+        return
+    load_details()
+    schedule = {}
+    details = {}
+    for question, fields in questions.items():
+        schedule[question] = {key: fields[key] for key in SCHEDULE_FIELDS if key in fields}
+        details[question] = {key: value for key, value in fields.items() if key not in SCHEDULE_FIELDS}
+    write_json(DETAILS_FILE, details)
+    write_json(DATA_FILE, schedule)
+    os.remove(REVIEW_LOG_FILE)
 
 load_questions()
 
@@ -69,8 +302,19 @@ difficulty_order = {
     "Tries": 16,
     "DP": 17
 }
+difficulty_order_lower = {k.lower(): k for k in difficulty_order}
 
 interval_cap = 365
+TOTAL_FIELDS = ("ratings_sum", "ratings_count", "time_sum", "time_count")
+REVIEW_FIELDS = (
+    "current_retention_rate", "ratings_sum", "ratings_count", "time_sum", "time_count", "average_time",
+    "interval", "stability", "difficulty", "next_review", "feynman", "last_reviewed"
+)
+
+
+def today_est():
+    return (datetime.now(timezone.utc) + timedelta(hours=-4)).date()
+
 
 
 class FSRS:
@@ -84,13 +328,15 @@ class FSRS:
         self.request_retention = request_retention
         self.maximum_interval = interval_cap
         self.DECAY = -0.4
-        self.FACTOR = 0.9 ** (1 / self.DECAY) - 1
+        self.INV_DECAY = 1 / self.DECAY
+        self.FACTOR = 0.9 ** self.INV_DECAY - 1
+        self.EXP_W8 = math.exp(self.w[8])
 
     def forgetting_curve(self, elapsed_days, stability):
         return (1 + self.FACTOR * elapsed_days / stability) ** self.DECAY
 
     def next_interval(self, stability, retention_factor):
-        new_interval = stability / self.FACTOR * (retention_factor ** (1 / self.DECAY) - 1)
+        new_interval = stability / self.FACTOR * (retention_factor ** self.INV_DECAY - 1)
         return min(max(round(new_interval), 1), self.maximum_interval)
 
     def next_difficulty(self, difficulty, rating):
@@ -100,9 +346,9 @@ class FSRS:
     def next_recall_stability(self, difficulty, stability, retrievability, rating):
         return stability * (
                 1
-                + math.exp(self.w[8])
+                + self.EXP_W8
                 * (11 - difficulty)
-                * math.pow(stability, -self.w[9])
+                * stability ** -self.w[9]
                 * (math.exp((1 - retrievability) * self.w[10]) - 1)
         ) * (self.w[15] if rating == 2 else 1)
 
@@ -114,9 +360,7 @@ fsrs = FSRS()
 
 
 def add_question(fsrs, question, link, problem_type):
-    load_questions()
     problem_type_lower = problem_type.lower()
-    difficulty_order_lower = {k.lower(): k for k in difficulty_order.keys()}
     if problem_type_lower not in difficulty_order_lower:
         print(f"Invalid problem type. Please choose from the following: {', '.join(difficulty_order.keys())}")
         return
@@ -125,13 +369,17 @@ def add_question(fsrs, question, link, problem_type):
     retention_factor = (input("Enter the desired request retention (.8 for normal, .9-.95 for company): ").strip())
     company_tags_input = input("Enter the company tags (separated by commas if multiple): ").strip()
     company_tags = [tag.strip() for tag in company_tags_input.split(',')] if company_tags_input else []
+    today = today_est()
 
+    load_details()
+    if question in questions:
+        unindex_question(question)
     questions[question] = {
         "link": link,
         "problem_type": problem_type,
         "company_tags": company_tags,
-        "last_reviewed": (datetime.now(timezone.utc) + timedelta(hours=-4)).date().isoformat(),
-        "next_review": (datetime.now(timezone.utc) + timedelta(hours=-4) + timedelta(days=1)).date().isoformat(),
+        "last_reviewed": today.isoformat(),
+        "next_review": (today + timedelta(days=1)).isoformat(),
         "interval": 1,
         "stability": fsrs.w[0],
         "difficulty": 5.0,
@@ -140,40 +388,44 @@ def add_question(fsrs, question, link, problem_type):
         "feynman": "",
         "solving_time": [],
         "average_time": None,
-        "ratings": []
+        "ratings": [],
+        "ratings_sum": 0,
+        "ratings_count": 0,
+        "time_sum": 0,
+        "time_count": 0
     }
+    index_question(question)
+    log_change(question, questions[question])
     save_questions()
     print(f"Question '{question}' with link '{link}' and type '{problem_type}' added.")
 
 
-def calculate_average_time(solving_times):
-    if solving_times:
-        return sum(time['time_taken'] for time in solving_times) / len(solving_times)
-    return None
-
 def review_questions(company=None):
-    load_questions()
-    today = (datetime.now(timezone.utc) + timedelta(hours=-4)).date().isoformat()
+    today_date = today_est()
+    today = today_date.isoformat()
     
-    filtered_questions = [
-        (question, details) for question, details in questions.items()
-        if (company is None or company in details.get('company_tags', [])) and
-        (details["next_review"] <= today or details["last_reviewed"] == today)
-    ]
+    candidates = set(reviewed_index.get(today, ()))
+    for next_review, names in due_index.items():
+        if next_review <= today:
+            candidates |= names
+    if company is not None:
+        candidates &= company_index.get(company, set())
+    filtered_questions = [(question, questions[question]) for question in candidates]
     
-    sorted_questions = sorted(filtered_questions, key=lambda q: difficulty_order[q[1]["problem_type"]])
+    sorted_questions = sorted(filtered_questions, key=lambda q: (difficulty_order[q[1]["problem_type"]], q[0]))
     unreviewed_questions = [q for q in sorted_questions if q[1]["last_reviewed"] != today]
 
     if not unreviewed_questions:
         print("No questions to review today.")
         return
+    load_details()
 
     for question, details in sorted_questions:
         checkbox = "[x]" if details["last_reviewed"] == today else "[ ]"
         print(f"{checkbox} {question} ({details['problem_type']})")
 
     for question, details in unreviewed_questions:
-        if not review_single_question(question, details, today):
+        if not review_single_question(question, details, today_date):
             continue
 
     save_questions()
@@ -186,10 +438,13 @@ def review_single_question(question, details, today):
         print(f"Skipped '{question}'. It remains due for review.")
         return False
 
+    today_iso = today.isoformat()
     start_time = datetime.now(timezone.utc)
     rating = get_valid_input(f"Rate your recall of '{question}' (1-5): ", lambda x: 1 <= int(x) <= 5)
-    questions[question]["ratings"].append({"date": today, "rating": rating})
-    questions[question]["current_retention_rate"] = sum(5 if rating["rating"] >= 4 else rating["rating"] for rating in questions[question]["ratings"] if rating['rating']) / (len(questions[question]["ratings"]) * 5)    
+    questions[question]["ratings"].append({"date": today_iso, "rating": rating})
+    questions[question]["ratings_sum"] += 5 if rating >= 4 else rating
+    questions[question]["ratings_count"] += 1
+    questions[question]["current_retention_rate"] = questions[question]["ratings_sum"] / (questions[question]["ratings_count"] * 5)
     difference_in_retention = abs(questions[question]["current_retention_rate"] - questions[question]["retention_factor"]) * 100
     if questions[question]["current_retention_rate"] > questions[question]["retention_factor"]:
         print(f"You're hitting your retention goal! You're up by {difference_in_retention:.2f}%!")
@@ -197,25 +452,32 @@ def review_single_question(question, details, today):
         print(f"You're not hitting your retention goal. You're down by {difference_in_retention:.2f}%!")
 
     time_taken = (datetime.now(timezone.utc) - start_time).total_seconds() / 60
-    questions[question]["solving_time"].append({"date": today, "time_taken": time_taken})
-    questions[question]["average_time"] = calculate_average_time(questions[question]["solving_time"])
+    questions[question]["solving_time"].append({"date": today_iso, "time_taken": time_taken})
+    questions[question]["time_sum"] += time_taken
+    questions[question]["time_count"] += 1
+    questions[question]["average_time"] = questions[question]["time_sum"] / questions[question]["time_count"]
 
-    update_question_metrics(question, rating)
+    update_question_metrics(question, rating, today)
 
     explanation = input(f"Explain the solution to '{question}' as if teaching someone else: ").strip()
     questions[question]["feynman"] = explanation
-    questions[question]["last_reviewed"] = today
+    move_index(reviewed_index, question, questions[question]["last_reviewed"], today_iso)
+    questions[question]["last_reviewed"] = today_iso
+    log_change(question, {key: questions[question][key] for key in REVIEW_FIELDS}, {
+        "ratings": questions[question]["ratings"][-1],
+        "solving_time": questions[question]["solving_time"][-1]
+    })
 
     return True
 
-def update_question_metrics(question, rating):
+def update_question_metrics(question, rating, today):
     details = questions[question]
     last_interval = details["interval"]
     last_stability = details["stability"]
     last_difficulty = details["difficulty"]
     retention_factor = details["retention_factor"]
-    if config['COMPANY_PREP_MODE'] and config['COMPANY_PREP_TARGET'] not in details.get('company_tags', []):
-        retention_factor *= config.COMPANY_PREP_RETENTION_FACTOR
+    if company_prep_mode and company_prep_target not in details.get('company_tags', []):
+        retention_factor *= company_prep_retention_factor
     
     retrievability = fsrs.forgetting_curve(last_interval, last_stability)
     new_stability = fsrs.next_recall_stability(last_difficulty, last_stability, retrievability, rating)
@@ -227,8 +489,9 @@ def update_question_metrics(question, rating):
         new_stability = max(new_stability * 0.6, 0.1)
 
     new_interval = min(base_interval, interval_cap)
-    next_review = ((datetime.now(timezone.utc) + timedelta(hours=-4) + timedelta(days=new_interval))).date().isoformat()
+    next_review = (today + timedelta(days=new_interval)).isoformat()
 
+    move_index(due_index, question, details["next_review"], next_review)
     details.update({
         "interval": new_interval,
         "stability": new_stability,
@@ -246,26 +509,31 @@ def update_question_metrics(question, rating):
 
 def get_valid_input(prompt, validator):
     while True:
-        try:
-            user_input = input(prompt)
-            if validator(user_input):
-                return int(user_input)
-        except ValueError:
-            pass
+        user_input = input(prompt).strip()
+        if user_input.isdecimal() and validator(user_input):
+            return int(user_input)
+        print("Invalid input. Please try again.")
+
+
+menu_choices = frozenset("12345678")
+
+
+def get_menu_choice():
+    while True:
+        choice = input("Choose an option: ").strip()
+        if choice in menu_choices:
+            return choice
         print("Invalid input. Please try again.")
 
 
 def list_all_questions():
-    load_questions()
+    load_details()
     if not questions:
         print("No questions added yet.")
         return
-    grouped_questions = {}
+    grouped_questions = defaultdict(list)
     for question, details in questions.items():
-        problem_type = details["problem_type"]
-        if problem_type not in grouped_questions:
-            grouped_questions[problem_type] = []
-        grouped_questions[problem_type].append((question, details))
+        grouped_questions[details["problem_type"]].append((question, details))
 
     sorted_problem_types = sorted(grouped_questions.keys(), key=lambda pt: difficulty_order[pt])
 
@@ -275,6 +543,8 @@ def list_all_questions():
         for question, details in grouped_questions[problem_type]:
             print(f" - {question}")
             for key, value in details.items():
+                if key in TOTAL_FIELDS:
+                    continue
                 print(f"     {key.replace('_', ' ').title()}: {value}")
             print("")
     print(f"Total number of question: {len(questions)}")
@@ -289,27 +559,32 @@ def main():
         print("5. Exit and Commit")
         print("6. Toggle Company Prep Mode")
         print("7. View Statistics")
-        choice = get_valid_input("Choose an option: ", lambda x: x in "1234567")
+        print("8. Commit Changes")
+        choice = get_menu_choice()
         
-        if choice == 1:
+        if choice == "1":
             review_questions()
-        elif choice == 2:
+        elif choice == "2":
             add_new_question()
-        elif choice == 3:
+        elif choice == "3":
             list_all_questions()
-        elif choice == 4:
+        elif choice == "4":
             company = input("Enter the company to review: ").strip()
             review_questions(company)
-        elif choice == 5:
+        elif choice == "5":
             print("Goodbye!")
-            commit(SCRIPT_FILE)
-            commit(DATA_FILE)
-            commit('config')
+            wait_for_commit()
+            compact_questions()
+            commit_all(TRACKED_FILES)
             break
-        elif choice == 6:
+        elif choice == "6":
             toggle_company_prep_mode()
-        elif choice == 7:
+        elif choice == "7":
             view_statistics()
+        elif choice == "8":
+            wait_for_commit()
+            compact_questions()
+            commit_in_background(TRACKED_FILES)
 def add_new_question():
     question = input("Enter the question name: ")
     link = input("Enter the NeetCode/LeetCode link: ")
@@ -317,20 +592,38 @@ def add_new_question():
     problem_type = input("Enter the problem type: ")
     add_question(fsrs, question, link, problem_type)
 def toggle_company_prep_mode():
-    config['COMPANY_PREP_MODE'] = not config['COMPANY_PREP_MODE']
-    if config['COMPANY_PREP_MODE']:
-        config['COMPANY_PREP_TARGET'] = input("Enter the target company for prep mode: ").strip()
-        print(f"Company Prep Mode activated for {config['COMPANY_PREP_TARGET']}")
+    global company_prep_mode, company_prep_target
+    company_prep_mode = not company_prep_mode
+    if company_prep_mode:
+        company_prep_target = input("Enter the target company for prep mode: ").strip()
+        print(f"Company Prep Mode activated for {company_prep_target}")
     else:
-        config['COMPANY_PREP_TARGET'] = ""
+        company_prep_target = ""
         print("Company Prep Mode deactivated")
-    
-    with open('config', 'w') as f:
+    config['COMPANY_PREP_MODE'] = company_prep_mode
+    config['COMPANY_PREP_TARGET'] = company_prep_target
+    save_config()
+
+
+def save_config():
+    global saved_config
+    if config == saved_config:
+        return
+    with open('config', 'w', newline=config_newline) as f:
         for key, value in config.items():
             f.write(f"{key} = {value}\n")
+    saved_config = dict(config)
+    if config == loaded_config:
+        dirty_files.discard('config')
+    else:
+        mark_file_dirty('config')
 def view_statistics():
-    load_questions()
-    total_retention_rate = sum(details['current_retention_rate'] for details in questions.values() if details['current_retention_rate']) / sum(1 for details in questions.values() if details['current_retention_rate'])
+    load_details()
+    retention_rates = [details['current_retention_rate'] for details in questions.values() if details['current_retention_rate']]
+    if not retention_rates:
+        print("No reviewed questions yet.")
+        return
+    total_retention_rate = sum(retention_rates) / len(retention_rates)
     print(f"Total Retention Rate: {total_retention_rate}")
     print("Request Retention Rate: ", request_retention)
     print("Difference in retention rate: ", total_retention_rate - request_retention)